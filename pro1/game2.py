@@ -1,33 +1,43 @@
 import tkinter as tk
 import math
 import random
+import time
+
+STEP = 1 / 60  # Duration of one logic step in seconds
+MAX_LAG = 0.25  # Most game time a single frame may catch up on, in seconds
+SHOOT_STEPS = 30  # Steps between automatic shots (0.5 s)
+SPAWN_STEPS = 300  # Steps between enemy waves (5 s)
+BULLET_POOL = 32  # Bullet ovals created up front (more are added if needed)
+GRID_CELL = 40  # Collision grid cell size in pixels (twice the hit radius)
 
 # Class representing a player in the game
 class Player:
-    def __init__(self, canvas, game, start_x=100, start_y=100):
+    def __init__(self, canvas, game, image, start_x=100, start_y=100):
         self.canvas = canvas  # The canvas on which the player is drawn
         self.game = game  # The game instance
         self.x, self.y = start_x, start_y  # Initial position
-        self.speed = 5  # Movement speed
+        self.speed = 100  # Movement speed (pixels per second)
         self.health = 3  # Initial health
-        # Load player image and scale it
-        self.image = tk.PhotoImage(file="V.png").subsample(5, 5)
-        self.id = canvas.create_image(self.x, self.y, image=self.image, anchor=tk.CENTER)
+        self.id = canvas.create_image(self.x, self.y, image=image, anchor=tk.CENTER)
+        self.drawn_x, self.drawn_y = self.x, self.y  # Position last drawn on the canvas
 
-    def move(self, dx, dy):
-        """Move the player by dx, dy and update its position on the canvas."""
-        self.x += dx * self.speed
-        self.y += dy * self.speed
-        self.canvas.coords(self.id, self.x, self.y)
+    def move(self, dx, dy, dt):
+        """Move the player in direction dx, dy for dt seconds (drawn at the end of the frame)."""
+        if dx == 0 and dy == 0:
+            return
+        self.x += dx * self.speed * dt
+        self.y += dy * self.speed * dt
 
     def shoot(self, target_x, target_y):
         """Create a bullet aimed at the target coordinates if the game is not over."""
         if not self.game.is_game_over:
-            return Bullet(self.canvas, self.x, self.y, target_x, target_y, self.game)
+            item = self.game.take_bullet_item()
+            return Bullet(self.canvas, item, self.x, self.y, target_x, target_y, self.game)
 
     def check_collision(self, enemy):
         """Check if the player has collided with a given enemy."""
-        if math.hypot(self.x - enemy.x, self.y - enemy.y) < 20:
+        dx, dy = self.x - enemy.x, self.y - enemy.y
+        if dx * dx + dy * dy < 400:  # Within 20 pixels
             self.health -= 1  # Reduce health on collision
             self.game.update_lives()  # Update the displayed health
             if self.health <= 0:
@@ -37,88 +47,81 @@ class Player:
 
 # Class representing an enemy in the game
 class Enemy:
-    def __init__(self, canvas, x, y):
+    def __init__(self, canvas, item, x, y):
         self.canvas = canvas  # The canvas on which the enemy is drawn
         self.x, self.y = x, y  # Initial position
-        self.speed = 2  # Movement speed
-        # Load enemy image and scale it
-        self.image = tk.PhotoImage(file="eeee.png").subsample(5, 5)
-        self.id = canvas.create_image(self.x, self.y, image=self.image, anchor=tk.CENTER)
+        self.speed = 40  # Movement speed (pixels per second)
+        # Show a pooled canvas image at the start position
+        self.id = item
+        canvas.coords(self.id, self.x, self.y)
+        canvas.itemconfigure(self.id, state="normal")
 
-    def move_towards(self, player_x, player_y):
-        """Move the enemy towards the player's position."""
+    def move_towards(self, player_x, player_y, dt):
+        """Move the enemy towards the player's position for dt seconds."""
         dx, dy = player_x - self.x, player_y - self.y
-        distance = max(math.hypot(dx, dy), 1)  # Avoid division by zero
-        self.x += (dx / distance) * self.speed
-        self.y += (dy / distance) * self.speed
-        self.canvas.coords(self.id, self.x, self.y)
-
-    def is_hit(self, bullet_x, bullet_y):
-        """Check if the enemy has been hit by a bullet."""
-        return math.hypot(self.x - bullet_x, self.y - bullet_y) < 20
+        step = self.speed * dt / max((dx * dx + dy * dy) ** 0.5, 1)  # Avoid division by zero
+        self.x += dx * step
+        self.y += dy * step
 
 # Class representing a bullet in the game
 class Bullet:
-    def __init__(self, canvas, start_x, start_y, target_x, target_y, game):
+    def __init__(self, canvas, item, start_x, start_y, target_x, target_y, game):
         self.canvas = canvas  # The canvas on which the bullet is drawn
         self.x, self.y = start_x, start_y  # Initial position
-        self.speed = 10  # Speed of the bullet
-        # Calculate angle and velocity based on target coordinates
-        self.angle = math.atan2(target_y - start_y, target_x - start_x)
-        self.dx = self.speed * math.cos(self.angle)
-        self.dy = self.speed * math.sin(self.angle)
-        self.id = canvas.create_oval(self.x - 5, self.y - 5, self.x + 5, self.y + 5, fill="yellow")
+        self.speed = 200  # Speed of the bullet (pixels per second)
+        # Calculate velocity by normalizing the direction to the target
+        dx, dy = target_x - start_x, target_y - start_y
+        distance = math.hypot(dx, dy)
+        if distance == 0:  # Target is on the player, so fire to the right
+            dx, distance = 1, 1
+        self.dx = dx * self.speed / distance
+        self.dy = dy * self.speed / distance
+        # Show a pooled canvas oval at the start position
+        self.id = item
+        canvas.coords(self.id, self.x - 5, self.y - 5, self.x + 5, self.y + 5)
+        canvas.itemconfigure(self.id, state="normal")
+        self.drawn_x, self.drawn_y = self.x, self.y  # Position last drawn on the canvas
         self.game = game  # The game instance
-        self.alive = True  # Bullet is initially alive
-        self.move()  # Start moving the bullet
 
-    def move(self):
-        """Move the bullet and check for collisions or boundaries."""
-        if not self.alive or self.game.is_game_over:
-            return
-        self.x += self.dx
-        self.y += self.dy
-        if not self.is_in_bounds():
-            self.game.remove_bullet(self)  # Remove bullet if out of bounds
-        else:
-            self.canvas.coords(self.id, self.x - 5, self.y - 5, self.x + 5, self.y + 5)
-            self.check_collision()  # Check if the bullet hits any enemy
-            if self.alive:
-                self.canvas.after(50, self.move)  # Continue moving the bullet
+    def move(self, dt):
+        """Advance the bullet by dt seconds (drawn at the end of the frame)."""
+        self.x += self.dx * dt
+        self.y += self.dy * dt
 
     def is_in_bounds(self):
         """Check if the bullet is within the canvas boundaries."""
-        width, height = self.canvas.winfo_width(), self.canvas.winfo_height()
-        return 0 <= self.x <= width and 0 <= self.y <= height
-
-    def check_collision(self):
-        """Check if the bullet has hit any enemy and update game state."""
-        for enemy in self.game.enemies[:]:
-            if enemy.is_hit(self.x, self.y):
-                self.game.remove_enemy(enemy)  # Remove the hit enemy
-                self.game.remove_bullet(self)  # Remove the bullet
-                self.game.score += 1  # Increment score
-                self.game.update_score()  # Update score display
-                break
+        return 0 <= self.x <= self.game.width and 0 <= self.y <= self.game.height
 
 # Main game class
 class Game:
     def __init__(self, root):
         self.root = root  # The Tkinter root window
-        self.canvas = tk.Canvas(root, width=800, height=600, bg="white")
+        self.width, self.height = 800, 600  # Canvas size, kept current by resize()
+        self.canvas = tk.Canvas(root, width=self.width, height=self.height, bg="white")
         self.canvas.pack()
-        self.player = Player(self.canvas, self)  # Create the player
+        # Load and scale the images once; Game keeps them alive for every sprite that shares them
+        self.player_img = tk.PhotoImage(file="V.png").subsample(5, 5)
+        self.enemy_img = tk.PhotoImage(file="eeee.png").subsample(5, 5)
+        self.player = Player(self.canvas, self, self.player_img)  # Create the player
         self.enemies = []  # List to keep track of enemies
         self.bullets = []  # List to keep track of bullets
+        self.enemy_index = {}  # Maps id(enemy) to its position in self.enemies
+        self.bullet_index = {}  # Maps id(bullet) to its position in self.bullets
+        # Hidden canvas items that new bullets and enemies reuse instead of creating their own
+        self.free_bullet_items = [self.new_bullet_item() for _ in range(BULLET_POOL)]
+        self.free_enemy_items = []
+        self.grid = {}  # Enemies bucketed by collision grid cell
         self.pressed_keys = set()  # Track pressed keys
+        self.move_x, self.move_y = 0, 0  # Movement direction from the pressed keys
         self.mouse_x, self.mouse_y = None, None  # Track mouse position
         self.is_game_over = False  # Flag to indicate if the game is over
         self.score = 0  # Initialize score
+        self.steps = 0  # Number of logic steps elapsed
+        self.last_time = time.perf_counter()  # When the previous frame started
+        self.lag = 0.0  # Game time not yet simulated, in seconds
         self.setup_ui()  # Set up the user interface
         self.setup_events()  # Set up event handlers
-        self.update()  # Start the game update loop
-        self.shoot_continuously()  # Start continuous shooting
-        self.spawn_enemies_periodically()  # Start periodic enemy spawning
+        self.tick()  # Start the game loop
 
     def setup_ui(self):
         """Set up the user interface elements (score and lives display)."""
@@ -127,62 +130,186 @@ class Game:
 
     def setup_events(self):
         """Bind events to handlers for key presses, key releases, and mouse movement."""
-        self.root.bind("<KeyPress>", lambda e: self.pressed_keys.add(e.keysym))
-        self.root.bind("<KeyRelease>", lambda e: self.pressed_keys.discard(e.keysym))
+        self.root.bind("<KeyPress>", self.key_press)
+        self.root.bind("<KeyRelease>", self.key_release)
         self.root.bind("<Motion>", self.track_mouse)
+        self.canvas.bind("<Configure>", self.resize)
 
     def spawn_enemies(self, count):
         """Spawn a specified number of enemies at random positions."""
         for _ in range(count):
             x, y = random.randint(50, 750), random.randint(50, 550)
-            self.enemies.append(Enemy(self.canvas, x, y))
+            enemy = Enemy(self.canvas, self.take_enemy_item(), x, y)
+            self.enemy_index[id(enemy)] = len(self.enemies)
+            self.enemies.append(enemy)
 
-    def spawn_enemies_periodically(self):
-        """Periodically spawn enemies at intervals."""
-        if not self.is_game_over:
-            self.spawn_enemies(3)  # Spawn 3 enemies at a time
-            self.root.after(5000, self.spawn_enemies_periodically)  # Call again after 5000ms
+    def new_bullet_item(self):
+        """Create a hidden bullet oval for the pool."""
+        return self.canvas.create_oval(-10, -10, 0, 0, fill="yellow", state="hidden")
+
+    def take_bullet_item(self):
+        """Return a hidden bullet oval from the pool, creating one if the pool is empty."""
+        return self.free_bullet_items.pop() if self.free_bullet_items else self.new_bullet_item()
+
+    def take_enemy_item(self):
+        """Return a hidden enemy image from the pool, creating one if the pool is empty."""
+        if self.free_enemy_items:
+            return self.free_enemy_items.pop()
+        return self.canvas.create_image(0, 0, image=self.enemy_img, anchor=tk.CENTER, state="hidden")
+
+    def key_press(self, event):
+        """Record a pressed key and update the movement direction."""
+        self.pressed_keys.add(event.keysym)
+        self.update_direction()
+
+    def key_release(self, event):
+        """Forget a released key and update the movement direction."""
+        self.pressed_keys.discard(event.keysym)
+        self.update_direction()
+
+    def update_direction(self):
+        """Recompute the movement direction, so steps never have to look at the pressed keys."""
+        self.move_x = (('d' in self.pressed_keys) - ('a' in self.pressed_keys))
+        self.move_y = (('s' in self.pressed_keys) - ('w' in self.pressed_keys))
+
+    def resize(self, event):
+        """Remember the new canvas size."""
+        self.width, self.height = event.width, event.height
 
     def track_mouse(self, event):
         """Update the tracked mouse position."""
         self.mouse_x, self.mouse_y = event.x, event.y
 
-    def update(self):
-        """Update game state, including player movement, enemy movement, and collisions."""
+    def tick(self):
+        """Run as many fixed logic steps as real time requires, then redraw once."""
         if self.is_game_over:
             return
 
-        dx = (('d' in self.pressed_keys) - ('a' in self.pressed_keys))
-        dy = (('s' in self.pressed_keys) - ('w' in self.pressed_keys))
-        self.player.move(dx, dy)  # Move player based on pressed keys
+        now = time.perf_counter()
+        self.lag += min(now - self.last_time, MAX_LAG)  # Don't try to catch up after a long stall
+        self.last_time = now
+        while self.lag >= STEP and not self.is_game_over:
+            self.step(STEP)
+            self.lag -= STEP
+
+        if not self.is_game_over:
+            self.redraw()
+            elapsed = time.perf_counter() - now
+            self.root.after(max(1, int((STEP - elapsed) * 1000)), self.tick)  # Schedule the next frame
+
+    def step(self, dt):
+        """Advance the game state by dt seconds."""
+        self.player.move(self.move_x, self.move_y, dt)  # Move player based on pressed keys
+
+        # Look these up once instead of on every loop iteration
+        enemies = self.enemies
+        px, py = self.player.x, self.player.y
+        check_collision = self.player.check_collision
+        remove_enemy = self.remove_enemy
+        # Walk the lists backwards so swap-removal only moves already visited entities
+        for i in range(len(enemies) - 1, -1, -1):
+            enemy = enemies[i]
+            enemy.move_towards(px, py, dt)  # Move enemies towards player
+            if check_collision(enemy):
+                remove_enemy(enemy)  # Handle collision with player
+        if self.is_game_over:
+            return  # The last life was lost, so nothing else may happen this step
+
+        self.update_bullets(dt)  # Move bullets and check if any bullet hits an enemy
+
+        if self.steps % SHOOT_STEPS == 0:
+            self.shoot()  # Shoot towards the mouse cursor
+        if self.steps % SPAWN_STEPS == 0:
+            self.spawn_enemies(3)  # Spawn 3 enemies at a time
+        self.steps += 1
+
+    def update_bullets(self, dt):
+        """Move, bounds-check and hit-test every bullet in a single pass over the bullets.
+
+        Enemies are bucketed into grid cells first so each bullet is only tested against nearby cells.
+        """
+        grid = self.grid
+        grid.clear()  # Reuse the same dict every step
+        for enemy in self.enemies:
+            grid.setdefault((int(enemy.x) // GRID_CELL, int(enemy.y) // GRID_CELL), []).append(enemy)
+        bullets = self.bullets
+        find_target = self.find_target
+        remove_bullet = self.remove_bullet
+        for i in range(len(bullets) - 1, -1, -1):
+            bullet = bullets[i]
+            bullet.move(dt)
+            if not bullet.is_in_bounds():
+                remove_bullet(bullet)  # Remove bullet if out of bounds
+                continue
+            hit = find_target(bullet.x, bullet.y)
+            if hit:
+                cell, enemy = hit
+                cell.remove(enemy)  # A dead enemy cannot be hit again
+                self.remove_enemy(enemy)  # Remove the hit enemy
+                remove_bullet(bullet)  # Remove the bullet
+                self.score += 1  # Increment score
+                self.update_score()  # Update score display
 
-        for enemy in self.enemies[:]:
-            enemy.move_towards(self.player.x, self.player.y)  # Move enemies towards player
-            if self.player.check_collision(enemy):
-                self.remove_enemy(enemy)  # Handle collision with player
+    def find_target(self, x, y):
+        """Return the grid cell and enemy within 20 pixels of (x, y), or None."""
+        get_cell = self.grid.get
+        cx, cy = int(x) // GRID_CELL, int(y) // GRID_CELL
+        for gx in (cx - 1, cx, cx + 1):
+            for gy in (cy - 1, cy, cy + 1):
+                cell = get_cell((gx, gy))
+                if cell:
+                    for enemy in cell:
+                        dx, dy = x - enemy.x, y - enemy.y
+                        if dx * dx + dy * dy < 400:  # Within 20 pixels
+                            return cell, enemy
+        return None
 
-        self.root.after(50, self.update)  # Continue updating game state
+    def redraw(self):
+        """Move every canvas item to its entity's current position."""
+        move, coords = self.canvas.move, self.canvas.coords
+        player = self.player
+        if player.x != player.drawn_x or player.y != player.drawn_y:  # Idle player needs no Tk call
+            move(player.id, player.x - player.drawn_x, player.y - player.drawn_y)
+            player.drawn_x, player.drawn_y = player.x, player.y
+        for enemy in self.enemies:
+            coords(enemy.id, enemy.x, enemy.y)
+        for bullet in self.bullets:
+            # Shift the oval by how far the bullet travelled instead of resending all four corners
+            move(bullet.id, bullet.x - bullet.drawn_x, bullet.y - bullet.drawn_y)
+            bullet.drawn_x, bullet.drawn_y = bullet.x, bullet.y
+        self.canvas.update_idletasks()  # Flush the whole frame in one redraw
 
-    def shoot_continuously(self):
-        """Continuously shoot bullets towards the mouse cursor."""
-        if not self.is_game_over and self.mouse_x is not None and self.mouse_y is not None:
+    def shoot(self):
+        """Shoot a bullet towards the mouse cursor."""
+        if self.mouse_x is not None and self.mouse_y is not None:
             bullet = self.player.shoot(self.mouse_x, self.mouse_y)
             if bullet:
+                self.bullet_index[id(bullet)] = len(self.bullets)
                 self.bullets.append(bullet)
-        self.root.after(500, self.shoot_continuously)  # Call again after 500ms
 
     def remove_enemy(self, enemy):
-        """Remove an enemy from the canvas and the list."""
-        self.canvas.delete(enemy.id)
-        self.enemies.remove(enemy)
+        """Hide an enemy, return its image to the pool and remove it from the list."""
+        self.canvas.itemconfigure(enemy.id, state="hidden")
+        self.free_enemy_items.append(enemy.id)
+        # Fill the gap with the last enemy so removal is O(1)
+        i = self.enemy_index.pop(id(enemy))
+        last = self.enemies.pop()
+        if last is not enemy:
+            self.enemies[i] = last
+            self.enemy_index[id(last)] = i
         self.update_score()  # Update score after removing an enemy
 
     def remove_bullet(self, bullet):
-        """Remove a bullet from the canvas and the list."""
-        if bullet in self.bullets:
-            bullet.alive = False
-            self.canvas.delete(bullet.id)
-            self.bullets.remove(bullet)
+        """Hide a bullet, return its oval to the pool and remove it from the list."""
+        i = self.bullet_index.pop(id(bullet), None)
+        if i is not None:
+            self.canvas.itemconfigure(bullet.id, state="hidden")
+            self.free_bullet_items.append(bullet.id)
+            # Fill the gap with the last bullet so removal is O(1)
+            last = self.bullets.pop()
+            if last is not bullet:
+                self.bullets[i] = last
+                self.bullet_index[id(last)] = i
 
     def update_score(self):
         """Update the score display on the canvas."""